@@ -1,5 +1,6 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Dict, List, Tuple
 
 import numpy as np
@@ -12,11 +13,21 @@ import plotly.graph_objects as go
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from utils.mesh_utils import meshcode_to_latlon
 
+try:
+    from numba import njit
+except ImportError:  # numbaが無い環境ではNumPy実装にフォールバック
+    njit = None
+
 # --- Constants ---
 DEFAULT_LAT = 35.6813489
 DEFAULT_LON = 139.766029
 MESH_LEVEL_MAP = {1: 4, 2: 6, 3: 8, 4: 9, 5: 10, 6: 11}
+# これを超えるポリゴン数はブラウザへの転送・描画が破綻するため、粗いレベルへ自動降格する
+# （都内の6次メッシュは約6.5万でこの範囲に収まる。全国データ等への備え）
+MAX_RENDER_MESHES = 100_000
 CSV_PATH = "data/processed/tblT001227E13.csv"
+PARQUET_PATH = "data/processed/tblT001227E13.parquet"
+AGG_PARQUET_PATH = "data/processed/agg_level{level}.parquet"
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -87,33 +98,109 @@ def apply_custom_css():
     """)
 
 
+def _grouped_weighted_sums(
+    labels: np.ndarray,
+    pop_vals: np.ndarray,
+    age_vals: np.ndarray,
+    weights: np.ndarray,
+    n_groups: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """人口列の合計と年齢列の重み付き合計を1回の走査で同時に集計する（numba JIT対象）"""
+    pop_sums = np.zeros((n_groups, pop_vals.shape[1]))
+    age_sums = np.zeros((n_groups, age_vals.shape[1]))
+    for i in range(labels.shape[0]):
+        g = labels[i]
+        w = weights[i]
+        for j in range(pop_vals.shape[1]):
+            pop_sums[g, j] += pop_vals[i, j]
+        for j in range(age_vals.shape[1]):
+            age_sums[g, j] += age_vals[i, j] * w
+    return pop_sums, age_sums
+
+
+if njit is not None:
+    _grouped_weighted_sums = njit(cache=True, nogil=True)(_grouped_weighted_sums)
+
+
+def _write_parquet_atomic(df: pd.DataFrame, path: str) -> None:
+    """一時ファイル経由でparquetを書き、ワーカープロセスとの書き込み競合を避ける"""
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    df.to_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, path)
+
+
 @st.cache_data
 def load_base_data() -> Optional[pd.DataFrame]:
     """
     CSVからベースとなるデータを読み込み、基本的な型変換とクレンジングを行う。
-    
+    初回はCSVをパースして型付きparquetを書き出し、2回目以降はparquetを読むだけで済ませる。
+
     Returns:
         pd.DataFrame or None: 読み込み済みのDataFrame
     """
+    if os.path.exists(PARQUET_PATH):
+        df = pd.read_parquet(PARQUET_PATH)
+        # 旧形式（文字列KEY_CODE）のparquetも読めるようにしておく
+        if df["KEY_CODE"].dtype != np.int64:
+            df["KEY_CODE"] = df["KEY_CODE"].astype(np.int64)
+        return df
+
     if not os.path.exists(CSV_PATH):
         st.error(f"データファイルが見つかりません: {CSV_PATH}")
         return None
-    
-    df = pd.read_csv(CSV_PATH, low_memory=False)
-    
-    # 統計関連のカラムを数値型に変換
+
+    # pyarrowエンジンはマルチスレッドで、数値カラムを型付きで返すため
+    # 列ごとのto_numericによる再変換が不要になる
+    df = pd.read_csv(CSV_PATH, engine="pyarrow", dtype_backend="numpy_nullable")
+
+    # 秘匿フラグ('Y'等)が混ざって文字列になった列だけ数値化し、残りは欠損を0に揃えるだけでよい
     stat_cols = [c for c in df.columns if any(k in c for k in ["人口", "平均年齢", "年齢中位数"])]
     for col in stat_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-    
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    # 国勢調査の人数・年齢はfloat32で十分表現できるので、幅を半分に落とす
+    df[stat_cols] = df[stat_cols].fillna(0).astype(np.float32)
+
     # 人口が存在するメッシュのみに絞り込み
     if "人口（総数）" in df.columns:
-        df = df[df["人口（総数）"] > 0].copy()
-    
-    df["KEY_CODE"] = df["KEY_CODE"].astype(str)
+        df = df[df["人口（総数）"] > 0]
+
+    # 以降の集計・描画で実際に参照する列だけを残す
+    # （行政コード等の未使用列をgroupby・キャッシュ・parquetに引き回さない）
+    keep_cols = [c for c in ["KEY_CODE", "人口（総数）", "平均年齢", "年齢中位数"] if c in df.columns]
+    keep_cols += [c for c in df.columns if "歳人口" in c]
+    df = df[keep_cols].copy()
+
+    # KEY_CODEは数字のみの11桁なので整数のまま保持する
+    # （レベル切替時の切り詰めは文字列スライスではなく整数除算で行う）
+    df["KEY_CODE"] = df["KEY_CODE"].astype(np.int64)
+
+    _write_parquet_atomic(df, PARQUET_PATH)
     return df
 
 
+def _polygon_corners(df: pd.DataFrame) -> list:
+    """
+    bbox列（min/max lon/lat）から各メッシュの頂点リストを一括構築する。
+
+    PolygonLayerはリングを自動で閉じるため終端頂点は持たせず、座標は
+    小数6桁（約0.1m）に丸めてJSONペイロードを圧縮する。pydeckのJSON
+    シリアライザはndarrayセルを文字列化してしまうため、ネストした
+    Pythonリストで返す。
+    """
+    min_lon = df["min_lon"].to_numpy()
+    min_lat = df["min_lat"].to_numpy()
+    max_lon = df["max_lon"].to_numpy()
+    max_lat = df["max_lat"].to_numpy()
+    corners = np.stack([
+        np.stack([min_lon, min_lat], axis=1),
+        np.stack([max_lon, min_lat], axis=1),
+        np.stack([max_lon, max_lat], axis=1),
+        np.stack([min_lon, max_lat], axis=1),
+    ], axis=1)
+    return np.round(corners, 6).tolist()
+
+
 @st.cache_data
 def get_aggregated_data(level: int) -> Optional[pd.DataFrame]:
     """
@@ -125,58 +212,167 @@ def get_aggregated_data(level: int) -> Optional[pd.DataFrame]:
     Returns:
         pd.DataFrame or None: 集約済みのデータ
     """
+    # プロセス再起動後もgroupby・地理計算をやり直さないよう、レベルごとに永続化する
+    agg_path = AGG_PARQUET_PATH.format(level=level)
+    if os.path.exists(agg_path):
+        agg_df = pd.read_parquet(agg_path)
+        # parquet経由ではリスト列がndarrayのネストで返ってきてpydeckのJSON化で
+        # 壊れるため、bbox列からPythonリストのポリゴンを作り直す
+        agg_df["polygon"] = _polygon_corners(agg_df)
+        return agg_df
+
     df = load_base_data()
     if df is None:
         return None
-    
+
     code_len = MESH_LEVEL_MAP.get(level, 11)
-    df["TARGET_CODE"] = df["KEY_CODE"].str[:code_len]
-    
+    df["TARGET_CODE"] = df["KEY_CODE"] // 10 ** (11 - code_len)
+
     # カラムの分類
     pop_cols = [c for c in df.columns if "人口" in c]
     age_cols = [c for c in df.columns if "平均年齢" in c or "年齢中位数" in c]
     
-    # 加重平均用の重み計算
-    weight_col = "人口（総数）"
-    for col in age_cols:
-        df[f"_{col}_weighted"] = df[col] * df[weight_col]
-    
     # 集計実行
-    agg_dict = {col: "sum" for col in pop_cols}
-    for col in age_cols:
-        agg_dict[f"_{col}_weighted"] = "sum"
-        
-    agg_df = df.groupby("TARGET_CODE").agg(agg_dict).reset_index()
-    
+    # 列ごとにハッシュ・縮約が走るgroupbyを避け、整数ラベル化して
+    # 人口合計と年齢の重み付き合計を1回の走査でまとめてリダクションする。
+    # 重み乗算はカーネル内で融合するので _{col}_weighted 列の実体化も不要
+    weight_col = "人口（総数）"
+    labels, uniques = pd.factorize(df["TARGET_CODE"].to_numpy(), sort=True)
+    pop_vals = df[pop_cols].to_numpy(np.float64)
+    age_vals = df[age_cols].to_numpy(np.float64)
+    weights = df[weight_col].to_numpy(np.float64)
+
+    if njit is not None:
+        pop_sums, age_sums = _grouped_weighted_sums(
+            labels, pop_vals, age_vals, weights, len(uniques)
+        )
+    else:
+        pop_sums = np.zeros((len(uniques), len(pop_cols)))
+        np.add.at(pop_sums, labels, pop_vals)
+        age_sums = np.zeros((len(uniques), len(age_cols)))
+        np.add.at(age_sums, labels, age_vals * weights[:, None])
+
+    agg_df = pd.DataFrame(pop_sums, columns=pop_cols)
+    # デコードと表示（ツールチップ）に使う文字列表現へはここで一度だけ戻す
+    # （1次メッシュの緯度コードは30台以上なので先頭の0埋めは起こらない）
+    agg_df.insert(0, "TARGET_CODE", uniques.astype(str))
+
     # 年齢関連の加重平均を算出
-    for col in age_cols:
-        agg_df[col] = (agg_df[f"_{col}_weighted"] / agg_df[weight_col].replace(0, np.nan)).fillna(0)
-        agg_df.drop(columns=[f"_{col}_weighted"], inplace=True)
+    # replace(0, nan) + fillna(0) の中間Seriesを作らず、マスク付き除算で一度に求める
+    denom = agg_df[weight_col].to_numpy()
+    for k, col in enumerate(age_cols):
+        num = age_sums[:, k]
+        agg_df[col] = np.divide(num, denom, out=np.zeros_like(num), where=denom > 0)
     
     # 地理情報の計算
     with st.spinner(f"Level {level} の地理情報を計算中..."):
         coords = meshcode_to_latlon(agg_df["TARGET_CODE"], mode="bbox")
         agg_df = pd.concat([agg_df, coords], axis=1)
-        
-        center_coords = meshcode_to_latlon(agg_df["TARGET_CODE"], mode="center")
-        agg_df["lat_center"] = center_coords["lat"]
-        agg_df["lon_center"] = center_coords["lon"]
+
+        # 中心点はbboxの中点なので、デコードをもう一周せずに導出する
+        agg_df["lat_center"] = (agg_df["min_lat"] + agg_df["max_lat"]) * 0.5
+        agg_df["lon_center"] = (agg_df["min_lon"] + agg_df["max_lon"]) * 0.5
         
         # ポリゴン作成の最適化
-        agg_df["polygon"] = agg_df.apply(
-            lambda r: [
-                [r["min_lon"], r["min_lat"]],
-                [r["max_lon"], r["min_lat"]],
-                [r["max_lon"], r["max_lat"]],
-                [r["min_lon"], r["max_lat"]],
-                [r["min_lon"], r["min_lat"]]
-            ], axis=1
-        )
+        # 行ごとのapplyではなく、4隅の座標列から頂点リストを一括構築する
+        agg_df["polygon"] = _polygon_corners(agg_df)
         agg_df = agg_df.rename(columns={"TARGET_CODE": "KEY_CODE"})
-        
+
+    _write_parquet_atomic(agg_df, agg_path)
     return agg_df
 
 
+def _precompute_aggregated_level(level: int) -> None:
+    """ワーカープロセス側でget_aggregated_dataを呼び、レベル別parquetを生成する"""
+    get_aggregated_data(level)
+
+
+@st.cache_resource
+def warm_aggregation_cache() -> ProcessPoolExecutor:
+    """
+    全メッシュレベルの集約parquetをバックグラウンドで先行生成する。
+
+    初回のレベル切り替えでgroupby・地理計算を待たせないよう、アイドルコアで
+    各レベルのagg_level{N}.parquetを作っておく。生成済みのレベルは
+    get_aggregated_dataがparquetを読むだけになる。
+    """
+    executor = ProcessPoolExecutor(max_workers=4)
+    for level in sorted(MESH_LEVEL_MAP, reverse=True):
+        executor.submit(_precompute_aggregated_level, level)
+    executor.shutdown(wait=False)
+    return executor
+
+
+@st.cache_data
+def compute_display(
+    level: int,
+    gender_suffix: str,
+    selected_ages: Tuple[str, ...],
+    display_type: str,
+    age_groups: Tuple[str, ...],
+) -> Optional[pd.DataFrame]:
+    """
+    フィルタ条件に依存する表示用の派生列を計算する。
+
+    地理情報付きのフレーム（get_aggregated_data）はレベルごとに不変なので、
+    性別・年代・表示モードで変わる列だけをここで計算してキャッシュする。
+
+    Args:
+        level (int): メッシュ階層 (1-6)
+        gender_suffix (str): 列名の性別サフィックス ("総数" / "男" / "女")
+        selected_ages (tuple): 選択された年代（空なら全年代）
+        display_type (str): "実数 (人数)" または "割合 (%)"
+        age_groups (tuple): 全年代のリスト
+
+    Returns:
+        pd.DataFrame or None: calculated_total / raw_value / display_value / fill_color
+    """
+    df = get_aggregated_data(level)
+    if df is None:
+        return None
+
+    # 年代×性別の値行列を1回だけ取り出し、分母（全年代合計）と分子（選択年代合計）を
+    # 同じ行列からの縮約・内積として計算する
+    mat = df[[f"{age}歳人口　{gender_suffix}" for age in age_groups]].to_numpy(np.float32)
+
+    # 1. 秘匿データ対応の分母再計算
+    calculated_total = mat.sum(axis=1)
+
+    # 2. 表示値（分子）の決定
+    if selected_ages:
+        selector = np.array([age in selected_ages for age in age_groups], np.float32)
+        raw_value = mat @ selector
+    else:
+        raw_value = calculated_total
+
+    # 表示モードに応じた値の計算 (実数 or 割合)
+    if display_type == "割合 (%)":
+        display_value = np.divide(
+            raw_value * 100.0, calculated_total,
+            out=np.zeros_like(raw_value), where=calculated_total > 0,
+        )
+    else:
+        display_value = raw_value
+
+    # 値を0-255に量子化してLUTから一括で色を引く（行ごとのPython呼び出しなし）
+    values = display_value.astype(np.float64)
+    max_val = float(values.max()) if len(values) else 0.0
+    if max_val > 0:
+        idx = np.clip((values / max_val * 255).astype(np.int32), 0, 255)
+    else:
+        idx = np.zeros(len(values), dtype=np.int32)
+    fill_color = HEATMAP_LUT[idx]
+
+    return pd.DataFrame({
+        "calculated_total": calculated_total,
+        "raw_value": raw_value,
+        "display_value": values,
+        # pydeckのJSONシリアライザはndarrayセルを文字列化してしまうため、
+        # 各行はPythonリスト（[r, g, b, a]）にして渡す
+        "fill_color": fill_color.tolist(),
+    })
+
+
 def get_heatmap_color(val: float, max_val: float) -> List[int]:
     """
     値をヒートマップカラー（青→緑→黄→赤）に変換する。
@@ -195,6 +391,45 @@ def get_heatmap_color(val: float, max_val: float) -> List[int]:
         return [255, int(255 * (1 - (normalized - 0.75) / 0.25)), 0, 160]
 
 
+# 正規化値(0-255)→RGBAの事前計算テーブル。描画時は量子化と添字参照だけで済む
+HEATMAP_LUT = np.array(
+    [get_heatmap_color(i, 255) for i in range(256)], dtype=np.uint8
+)
+
+
+def _format_thousands(values: np.ndarray) -> np.ndarray:
+    """非負の数値配列を3桁区切りの文字列配列へ一括変換する（行ごとのformat呼び出しなし）
+
+    12桁（10^12未満）までを想定。全国の総人口でも9桁なので十分な幅だが、
+    それ以上はastype("U12")で黙って切り詰められる点に注意。
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype="U15")
+
+    ints = np.round(values).astype(np.int64)
+    # 固定幅に右寄せし、3桁ごとの位置にカンマを差し込んでから余分な先頭文字を落とす
+    padded = np.char.rjust(ints.astype("U12"), 12)
+    chars = padded.view("U1").reshape(len(padded), 12)
+    grouped = np.full((len(padded), 15), ",", dtype="U1")
+    grouped[:, 0:3] = chars[:, 0:3]
+    grouped[:, 4:7] = chars[:, 3:6]
+    grouped[:, 8:11] = chars[:, 6:9]
+    grouped[:, 12:15] = chars[:, 9:12]
+    joined = np.ascontiguousarray(grouped).view("U15").ravel()
+    return np.char.lstrip(joined, " ,")
+
+
+def _format_fixed2(values: np.ndarray) -> np.ndarray:
+    """非負の数値配列を小数2桁固定の文字列配列へ一括変換する"""
+    if len(values) == 0:
+        return np.empty(0, dtype="U16")
+
+    cents = np.round(values * 100).astype(np.int64)
+    whole = (cents // 100).astype("U")
+    frac = np.char.zfill((cents % 100).astype("U"), 2)
+    return np.char.add(np.char.add(whole, "."), frac)
+
+
 def render_sidebar():
     """サイドバーのUI描画と入力取得"""
     st.sidebar.title("🎮 操作パネル")
@@ -309,7 +544,14 @@ def render_age_gender_chart(df: pd.DataFrame, age_groups: List[str]):
     chart_container = st.container()
     with chart_container:
         chart_col1, chart_col2 = st.columns([1, 3])
-        
+
+        # データの集計
+        # 年代ごとにSeries縮約を繰り返さず、対象列をまとめて1回の行列縮約で合計する
+        male_cols = [f"{age}歳人口　男" for age in age_groups]
+        female_cols = [f"{age}歳人口　女" for age in age_groups]
+        male_counts = df[male_cols].to_numpy().sum(axis=0)
+        female_counts = df[female_cols].to_numpy().sum(axis=0)
+
         with chart_col1:
             st.markdown("表示設定")
             chart_mode = st.radio(
@@ -321,8 +563,8 @@ def render_age_gender_chart(df: pd.DataFrame, age_groups: List[str]):
             )
             
             # 統計サマリー
-            male_total = sum([df[f"{age}歳人口　男"].sum() for age in age_groups])
-            female_total = sum([df[f"{age}歳人口　女"].sum() for age in age_groups])
+            male_total = male_counts.sum()
+            female_total = female_counts.sum()
             total_pop = male_total + female_total
             
             if total_pop > 0:
@@ -342,16 +584,9 @@ def render_age_gender_chart(df: pd.DataFrame, age_groups: List[str]):
                 </div>
                 """)
         
-        # データの集計
-        male_counts = []
-        female_counts = []
-        for age in age_groups:
-            male_counts.append(df[f"{age}歳人口　男"].sum())
-            female_counts.append(df[f"{age}歳人口　女"].sum())
-        
         if chart_mode == "割合 (%)" and total_pop > 0:
-            male_plot = [m / total_pop * 100 for m in male_counts]
-            female_plot = [f / total_pop * 100 for f in female_counts]
+            male_plot = male_counts / total_pop * 100
+            female_plot = female_counts / total_pop * 100
             x_label = "全体人口に対する割合 (%)"
             hover_suffix = "%"
         else:
@@ -365,7 +600,7 @@ def render_age_gender_chart(df: pd.DataFrame, age_groups: List[str]):
         # 男性を左側（負の値）に
         fig.add_trace(go.Bar(
             y=age_groups,
-            x=[-x for x in male_plot],
+            x=-male_plot,
             name="男",
             orientation='h',
             marker=dict(color='#58a6ff', line=dict(color='rgba(255, 255, 255, 0.2)', width=1)),
@@ -384,7 +619,7 @@ def render_age_gender_chart(df: pd.DataFrame, age_groups: List[str]):
         ))
         
         # レイアウト調整
-        max_val = max(max(male_plot), max(female_plot)) if male_plot else 0
+        max_val = max(male_plot.max(), female_plot.max()) if len(male_plot) else 0
         
         fig.update_layout(
             barmode='relative',
@@ -440,35 +675,42 @@ def main():
     if df is None:
         return
 
-    # 1. 秘匿データ対応の分母再計算
-    age_cols_to_sum = [f"{age}歳人口　{gender_suffix}" for age in age_groups]
-    if gender_suffix == "総数":
-         age_cols_to_sum = [f"{age}歳人口　総数" for age in age_groups]
-    
-    df["calculated_total"] = df[age_cols_to_sum].sum(axis=1)
+    # 描画上限を超える場合は、表示可能な密度まで1段ずつ粗いレベルへ降格する
+    effective_level = mesh_level
+    while effective_level > 1 and len(df) > MAX_RENDER_MESHES:
+        effective_level -= 1
+        df = get_aggregated_data(effective_level)
+    if effective_level != mesh_level:
+        st.info(
+            f"メッシュ数が描画上限 ({MAX_RENDER_MESHES:,}) を超えるため、"
+            f"レベル {mesh_level} の代わりにレベル {effective_level} で表示しています。"
+        )
+
+    # キャッシュ上のフレームを汚さないよう、派生列はコピーにのみ付与する
+    df = df.copy()
+
+    # フィルタ条件に依存する派生列（キャッシュ付き）
+    derived = compute_display(
+        effective_level, gender_suffix, tuple(selected_ages), display_type, tuple(age_groups)
+    )
+    df["calculated_total"] = derived["calculated_total"].to_numpy()
+    df["raw_value"] = derived["raw_value"].to_numpy()
+    df["display_value"] = derived["display_value"].to_numpy()
+    df["fill_color"] = derived["fill_color"].to_numpy()
 
-    # 2. 表示値（分子）の決定
     if selected_ages:
-        target_cols = [f"{age}歳人口　{gender_suffix}" for age in selected_ages]
-        if gender_suffix == "総数":
-             target_cols = [f"{age}歳人口　総数" for age in selected_ages]
-        
         display_name = f"{gender_label}: {', '.join(selected_ages)}"
-        df["raw_value"] = df[target_cols].sum(axis=1)
     else:
         display_name = f"{gender_label}: 全年代"
-        df["raw_value"] = df["calculated_total"]
 
-    # 表示モードに応じた値の計算 (実数 or 割合)
+    # 表示モードに応じたフォーマット (実数 or 割合)
     if display_type == "割合 (%)":
-        df["display_value"] = (df["raw_value"] / df["calculated_total"].replace(0, np.nan) * 100).fillna(0)
-        df["formatted_value"] = df["display_value"].map(lambda x: f"{x:.2f}%")
+        df["formatted_value"] = np.char.add(_format_fixed2(df["display_value"].to_numpy()), "%")
         unit_label = "%"
     else:
-        df["display_value"] = df["raw_value"]
-        df["formatted_value"] = df["display_value"].map(lambda x: f"{x:,.0f} 人")
+        df["formatted_value"] = np.char.add(_format_thousands(df["display_value"].to_numpy()), " 人")
         unit_label = "人"
-        
+
     # メトリクス表示
     render_metrics(df, "raw_value", gender_label)
 
@@ -479,14 +721,13 @@ def main():
     # 地図セクション
     st.divider()
     st.markdown(f"### 🗺️ {display_name} の分布 ({display_type})")
-    
-    max_val = df["display_value"].max()
-    df["fill_color"] = df["display_value"].apply(lambda v: get_heatmap_color(v, max_val))
 
-    df["formatted_age"] = df["平均年齢"].map(lambda x: f"{x:.2f}")
+    df["formatted_age"] = _format_fixed2(df["平均年齢"].to_numpy())
 
+    # pydeckに渡すのはレイヤー・ツールチップが実際に参照する列だけに絞る。
+    # 視点中心はスカラーで済むので、per-rowのlat_center/lon_centerは載せない
     map_data = df[[
-        "polygon", "fill_color", "display_value", "formatted_value", "formatted_age", "KEY_CODE", "lat_center", "lon_center"
+        "polygon", "fill_color", "formatted_value", "formatted_age", "KEY_CODE"
     ]]
 
     # 地図レイヤーの設定
@@ -520,7 +761,9 @@ def main():
     ))
     render_map_legend(unit_label)
 
-    
+    # 残りのレベルをアイドルコアで先行集約しておく（2回目以降は即時応答）
+    warm_aggregation_cache()
+
 
 if __name__ == "__main__":
     main()
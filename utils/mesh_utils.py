@@ -2,6 +2,12 @@ import numpy as np
 import pandas as pd
 from typing import Union, Dict, Tuple
 
+try:
+    from numba import njit, prange
+except ImportError:  # numbaが無い環境ではNumPy実装にフォールバック
+    njit = None
+    prange = range
+
 
 def latlon_to_meshcode(
     lat: Union[float, np.ndarray, pd.Series],
@@ -110,61 +116,164 @@ def meshcode_to_latlon(
         return res.iloc[0].to_dict()
 
 
+def _decode_mesh_bytes_kernel(buf, lengths, lat, lon, lat_delta, lon_delta):
+    """内部用：バイト列バッファを行並列でデコードするカーネル（numba JIT対象）"""
+    for i in prange(buf.shape[0]):
+        length = lengths[i]
+        la = (buf[i, 0] - 48) * 10.0 + (buf[i, 1] - 48)
+        lo = (buf[i, 2] - 48) * 10.0 + (buf[i, 3] - 48)
+        lat_v = la * (2.0 / 3.0)
+        lon_v = lo + 100.0
+        dlat = 2.0 / 3.0
+        dlon = 1.0
+
+        # 2次メッシュ (8x8分割)
+        if length >= 6:
+            dlat /= 8.0
+            dlon /= 8.0
+            lat_v += (buf[i, 4] - 48) * dlat
+            lon_v += (buf[i, 5] - 48) * dlon
+
+        # 3次メッシュ (10x10分割)
+        if length >= 8:
+            dlat /= 10.0
+            dlon /= 10.0
+            lat_v += (buf[i, 6] - 48) * dlat
+            lon_v += (buf[i, 7] - 48) * dlon
+
+        # 4次〜6次メッシュ (2x2分割、コード1-4 -> 緯度ビット・経度ビット)
+        for k in range(8, length):
+            dlat /= 2.0
+            dlon /= 2.0
+            d = buf[i, k] - 49
+            lat_v += ((d >> 1) & 1) * dlat
+            lon_v += (d & 1) * dlon
+
+        lat[i] = lat_v
+        lon[i] = lon_v
+        lat_delta[i] = dlat
+        lon_delta[i] = dlon
+
+
+if njit is not None:
+    _decode_mesh_bytes_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _decode_mesh_bytes_kernel
+    )
+
+
 def _meshcode_to_latlon_vectorized(s_code: pd.Series, mode: str) -> pd.DataFrame:
     """内部用：ベクトル化された変換処理"""
     n = len(s_code)
+    # 文字列スライスの代わりに、固定幅バイト列として一括変換して桁を直接参照する。
+    # 短いコードはNUL埋めされるが、長さマスクで無効桁は加算しない。
+    codes = np.ascontiguousarray(s_code.to_numpy().astype("S11"))
+    buf = codes.view(np.uint8).reshape(n, 11)
+    lengths = s_code.str.len().to_numpy(np.int64)
+
+    if njit is not None:
+        lat = np.empty(n)
+        lon = np.empty(n)
+        lat_delta = np.empty(n)
+        lon_delta = np.empty(n)
+        _decode_mesh_bytes_kernel(buf, lengths, lat, lon, lat_delta, lon_delta)
+        return _latlon_frame(lat, lon, lat_delta, lon_delta, mode)
+
+    digits = buf.astype(np.int64) - ord("0")
+
+    # このアプリでは1回の呼び出し内で全行が同じレベル（＝同じ桁数）になるのが
+    # 通常なので、その場合はマスクとnp.whereを使わないスカラー増分のパスで処理する
+    if n > 0 and (lengths == lengths[0]).all():
+        lat, lon, lat_delta, lon_delta = _decode_digits_uniform(digits, int(lengths[0]))
+        return _latlon_frame(lat, lon, lat_delta, lon_delta, mode)
+
     # 緯度・経度の増分（1次メッシュ基準）
     lat_delta = np.full(n, 2.0 / 3.0)
     lon_delta = np.full(n, 1.0)
-    
-    # 1次メッシュ部分 (1-4文字)
-    lat = s_code.str[0:2].astype(float) * lat_delta
-    lon = s_code.str[2:4].astype(float) + 100.0
-    
-    # 2次メッシュ部分 (5-6文字)
+
+    # 1次メッシュ部分 (1-4桁)
+    lat = (digits[:, 0] * 10 + digits[:, 1]) * lat_delta
+    lon = (digits[:, 2] * 10 + digits[:, 3]) + 100.0
+
+    # 2次メッシュ部分 (5-6桁)
     # 2次は1次を8x8分割
-    mask2 = s_code.str.len() >= 6
+    mask2 = lengths >= 6
     if mask2.any():
         lat_delta = np.where(mask2, lat_delta / 8.0, lat_delta)
         lon_delta = np.where(mask2, lon_delta / 8.0, lon_delta)
-        # s_code.str[4] が 緯度方向, [5] が 経度方向
-        m2_lat = s_code.str[4:5].replace('', '0').astype(float)
-        m2_lon = s_code.str[5:6].replace('', '0').astype(float)
-        lat += np.where(mask2, m2_lat * lat_delta, 0)
-        lon += np.where(mask2, m2_lon * lon_delta, 0)
+        # digits[:, 4] が 緯度方向, [:, 5] が 経度方向
+        lat += np.where(mask2, digits[:, 4] * lat_delta, 0)
+        lon += np.where(mask2, digits[:, 5] * lon_delta, 0)
 
-    # 3次メッシュ部分 (7-8文字)
+    # 3次メッシュ部分 (7-8桁)
     # 3次は2次を10x10分割
-    mask3 = s_code.str.len() >= 8
+    mask3 = lengths >= 8
     if mask3.any():
         lat_delta = np.where(mask3, lat_delta / 10.0, lat_delta)
         lon_delta = np.where(mask3, lon_delta / 10.0, lon_delta)
-        m3_lat = s_code.str[6:7].replace('', '0').astype(float)
-        m3_lon = s_code.str[7:8].replace('', '0').astype(float)
-        lat += np.where(mask3, m3_lat * lat_delta, 0)
-        lon += np.where(mask3, m3_lon * lon_delta, 0)
-
-    # 4次〜6次メッシュ部分 (9文字目以降)
-    # 4次以降は1文字ずつ加算。各階層を2x2分割。
-    max_len = s_code.str.len().max()
-    for i in range(8, int(max_len)):
-        mask_i = s_code.str.len() > i
+        lat += np.where(mask3, digits[:, 6] * lat_delta, 0)
+        lon += np.where(mask3, digits[:, 7] * lon_delta, 0)
+
+    # 4次〜6次メッシュ部分 (9桁目以降)
+    # 4次以降は1桁ずつ加算。各階層を2x2分割。
+    max_len = int(lengths.max())
+    for i in range(8, max_len):
+        mask_i = lengths > i
         if not mask_i.any():
             continue
-            
+
         lat_delta = np.where(mask_i, lat_delta / 2.0, lat_delta)
         lon_delta = np.where(mask_i, lon_delta / 2.0, lon_delta)
-        
+
         # コード1-4のデコード
-        # 1: (0,0), 2: (0,1), 3: (1,0), 4: (1,1) -> (lat_offset, lon_offset)
-        code_i = s_code.str[i:i+1].replace('', '0').astype(int)
-        
-        # 緯度加算: 3 or 4 の場合に lat_delta を加算
-        lat += np.where(mask_i & code_i.isin([3, 4]), lat_delta, 0)
-        # 経度加算: 2 or 4 の場合に lon_delta を加算
-        lon += np.where(mask_i & code_i.isin([2, 4]), lon_delta, 0)
+        # d = code - 1 とすると (緯度ビット, 経度ビット) = (d>>1 & 1, d & 1)
+        d = digits[:, i] - 1
+        lat += np.where(mask_i, ((d >> 1) & 1) * lat_delta, 0)
+        lon += np.where(mask_i, (d & 1) * lon_delta, 0)
+
+    return _latlon_frame(lat, lon, lat_delta, lon_delta, mode)
+
+
+def _decode_digits_uniform(
+    digits: np.ndarray, length: int
+) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """内部用：全行が同じ桁数のときのデコード。増分はスカラーでインプレース更新する"""
+    lat = (digits[:, 0] * 10 + digits[:, 1]) * (2.0 / 3.0)
+    lon = (digits[:, 2] * 10 + digits[:, 3]) + 100.0
+    lat_delta = 2.0 / 3.0
+    lon_delta = 1.0
+
+    # 2次メッシュ (8x8分割)
+    if length >= 6:
+        lat_delta /= 8.0
+        lon_delta /= 8.0
+        lat += digits[:, 4] * lat_delta
+        lon += digits[:, 5] * lon_delta
+
+    # 3次メッシュ (10x10分割)
+    if length >= 8:
+        lat_delta /= 10.0
+        lon_delta /= 10.0
+        lat += digits[:, 6] * lat_delta
+        lon += digits[:, 7] * lon_delta
+
+    # 4次〜6次メッシュ (2x2分割)
+    for i in range(8, length):
+        lat_delta /= 2.0
+        lon_delta /= 2.0
+        # d = code - 1 とすると (緯度ビット, 経度ビット) = (d>>1 & 1, d & 1)
+        d = digits[:, i] - 1
+        lat += ((d >> 1) & 1) * lat_delta
+        lon += (d & 1) * lon_delta
+
+    return lat, lon, lat_delta, lon_delta
+
 
-    # モードに応じた緯度経度の調整
+def _latlon_frame(
+    lat: np.ndarray, lon: np.ndarray,
+    lat_delta: Union[np.ndarray, float], lon_delta: Union[np.ndarray, float],
+    mode: str
+) -> pd.DataFrame:
+    """内部用：南西端とメッシュ幅からモードに応じた緯度経度フレームを組み立てる"""
     if mode == "sw":
         return pd.DataFrame({"lat": lat, "lon": lon})
     elif mode == "center":